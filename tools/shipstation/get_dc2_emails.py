@@ -12,16 +12,11 @@ from shipstation_mcp.core.operations import list_orders
 
 def has_dc2_product(order: dict) -> bool:
     """Check if order contains a DC2 product"""
-    items = order.get("items", [])
-    for item in items:
-        sku = (item.get("sku") or "").upper()
-        name = (item.get("name") or "").upper()
-
-        # Check for DC2 in SKU or product name
-        if "DC2" in sku or "DC2" in name:
-            return True
-
-    return False
+    # Check for DC2 in SKU or product name, stopping at the first hit
+    return any(
+        "DC2" in (item.get("sku") or "").upper() or "DC2" in (item.get("name") or "").upper()
+        for item in order.get("items") or ()
+    )
 
 
 def main() -> None:
@@ -31,16 +26,17 @@ def main() -> None:
         orders = list_orders(status="awaiting_shipment", limit=500)
         print(f"Found {len(orders)} total orders with awaiting_shipment status\n")
 
-        # Filter for DC2 orders
-        dc2_orders = [order for order in orders if has_dc2_product(order)]
-        print(f"Found {len(dc2_orders)} orders containing DC2 products\n")
-
-        # Extract unique emails
+        # Filter for DC2 orders and extract unique emails in one pass
+        dc2_count = 0
         emails = set()
-        for order in dc2_orders:
+        for order in orders:
+            if not has_dc2_product(order):
+                continue
+            dc2_count += 1
             email = order.get("customerEmail")
             if email:
                 emails.add(email)
+        print(f"Found {dc2_count} orders containing DC2 products\n")
 
         # Format for Gmail (comma-separated)
         email_list = ", ".join(sorted(emails))